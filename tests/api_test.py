@@ -1,3 +1,4 @@
+import json
 import shutil
 from collections.abc import Generator
 from pathlib import Path
@@ -51,12 +52,21 @@ def test_extract_frames_valid_default_request_success_is_true(
     expected_destpath = (
         fixture_tmp_video_properties["video_file_path"].parent / "tmp.video.mp4_frames"
     )
-    assert extract_frames_result.destpath == expected_destpath
+    assert extract_frames_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_dir()
 
 
+def test_extract_frames_result_destpath_is_resolved_posix_string(
+    extract_frames_result: Generator[Result, None, None],
+):
+    """Test that `Result.destpath` and its JSON form are the resolved POSIX path."""
+    destpath = extract_frames_result.destpath
+    assert destpath == Path(destpath).resolve().as_posix()
+    assert json.loads(extract_frames_result.json())["destpath"] == destpath
+
+
 def test_generic_extract_frames_valid_default_request_success_is_true(
     generic_extract_frames_result: Generator[Result, None, None],
     fixture_tmp_video_properties: dict[str, Any],
@@ -68,7 +78,7 @@ def test_generic_extract_frames_valid_default_request_success_is_true(
     expected_destpath = (
         fixture_tmp_video_properties["video_file_path"].parent / "tmp.video.mp4_frames"
     )
-    assert generic_extract_frames_result.destpath == expected_destpath
+    assert generic_extract_frames_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_dir()
@@ -108,7 +118,7 @@ def test_extract_audio_valid_default_request_success_is_true(
     expected_destpath = (
         fixture_tmp_video_properties["video_file_path"].parent / "tmp.video.mp3"
     )
-    assert extract_audio_result.destpath == expected_destpath
+    assert extract_audio_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_file()
@@ -124,7 +134,7 @@ def test_generic_extract_audio_valid_default_request_success_is_true(
     expected_destpath = (
         fixture_tmp_video_properties["video_file_path"].parent / "tmp.video.mp3"
     )
-    assert generic_extract_audio_result.destpath == expected_destpath
+    assert generic_extract_audio_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_file()
@@ -170,7 +180,7 @@ def test_extract_clip_valid_default_request_success_is_true(
         fixture_tmp_video_properties["video_file_path"].parent
         / "tmp.test.extract.clip.mp4"
     )
-    assert extract_clip_result.destpath == expected_destpath
+    assert extract_clip_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_file()
@@ -187,7 +197,7 @@ def test_generic_extract_clip_valid_default_request_success_is_true(
         fixture_tmp_video_properties["video_file_path"].parent
         / "tmp.test.extract.clip.mp4"
     )
-    assert generic_extract_clip_result.destpath == expected_destpath
+    assert generic_extract_clip_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_file()
@@ -227,7 +237,7 @@ def test_extract_gif_valid_default_request_success_is_true(
     expected_destpath = (
         fixture_tmp_video_properties["video_file_path"].parent / "tmp.video.gif"
     )
-    assert extract_gif_result.destpath == expected_destpath
+    assert extract_gif_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_file()
@@ -243,7 +253,7 @@ def test_generic_extract_gif_valid_default_request_success_is_true(
     expected_destpath = (
         fixture_tmp_video_properties["video_file_path"].parent / "tmp.video.gif"
     )
-    assert generic_extract_gif_result.destpath == expected_destpath
+    assert generic_extract_gif_result.destpath_path == expected_destpath.resolve()
     expected_destpath = Path(expected_destpath)
     assert expected_destpath.exists()
     assert expected_destpath.is_file()
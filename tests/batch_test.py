@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from videoxt.batch import prepare_all, probe_all
+from videoxt.requesters import (
+    FramesRequest,
+    GifRequest,
+    PreparedFramesRequest,
+    PreparedGifRequest,
+)
+from videoxt.video import Video
+
+
+def test_prepare_all_returns_prepared_requests_in_order(
+    fixture_tmp_video_filepath: Path,
+):
+    prepared = prepare_all(
+        [
+            (fixture_tmp_video_filepath, FramesRequest(capture_rate=5)),
+            (str(fixture_tmp_video_filepath), GifRequest(stop_time=1)),
+        ],
+        max_workers=2,
+    )
+
+    assert isinstance(prepared[0], PreparedFramesRequest)
+    assert isinstance(prepared[1], PreparedGifRequest)
+    assert all(p.is_prepared for p in prepared)
+    assert prepared[0].capture_rate == 5
+    assert prepared[1].extraction_range["stop_second"] == 1
+    assert prepared[0].video.filepath == fixture_tmp_video_filepath
+
+
+def test_probe_all_returns_videos_in_order(fixture_tmp_video_filepath: Path):
+    videos = probe_all(
+        [fixture_tmp_video_filepath, str(fixture_tmp_video_filepath)], max_workers=2
+    )
+
+    assert len(videos) == 2
+    assert all(isinstance(video, Video) for video in videos)
+    assert videos[0] == videos[1]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from videoxt.editors import BufferPool, edit_image
+
+
+@pytest.fixture
+def images() -> tuple[np.ndarray, np.ndarray]:
+    """Two different non-square BGR frames of the same shape."""
+    rng = np.random.default_rng(0)
+    return (
+        rng.integers(0, 256, (48, 64, 3), dtype=np.uint8),
+        rng.integers(0, 256, (48, 64, 3), dtype=np.uint8),
+    )
+
+
+def test_buffer_pool_get_reuses_buffers_per_key():
+    pool = BufferPool()
+    buffer = pool.get("resize", (2, 3, 3))
+
+    assert buffer.shape == (2, 3, 3)
+    assert buffer.dtype == np.uint8
+    assert pool.get("resize", (2, 3, 3)) is buffer
+    assert pool.get("rotate", (2, 3, 3)) is not buffer
+    assert pool.get("resize", (3, 2, 3)) is not buffer
+    assert pool.get("resize", (2, 3, 3), np.float32) is not buffer
+
+
+@pytest.mark.parametrize("dimensions", [None, (32, 24), (20, 40)])
+@pytest.mark.parametrize("rotate", [0, 90, 180, 270])
+@pytest.mark.parametrize("monochrome", [False, True])
+def test_edit_image_with_pool_matches_edit_image_without_pool(
+    images: tuple[np.ndarray, np.ndarray],
+    dimensions: tuple[int, int] | None,
+    rotate: int,
+    monochrome: bool,
+):
+    """Test that pooled edits match unpooled edits and reuse the same buffer."""
+    first_image, second_image = images
+    pool = BufferPool()
+
+    expected = edit_image(first_image, dimensions, rotate, monochrome)
+    first = edit_image(first_image, dimensions, rotate, monochrome, pool=pool)
+    assert first.shape == expected.shape
+    np.testing.assert_array_equal(first, expected)
+
+    expected = edit_image(second_image, dimensions, rotate, monochrome)
+    second = edit_image(second_image, dimensions, rotate, monochrome, pool=pool)
+    np.testing.assert_array_equal(second, expected)
+
+    if dimensions is not None or rotate != 0 or monochrome:
+        assert second is first
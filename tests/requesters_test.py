@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from videoxt.requesters import BaseRequest, PreparedBaseRequest
+from videoxt.video import Video
+
+
+def test_base_request_prepare_runs_the_prepare_steps(
+    fixture_tmp_video_filepath: Path, fixture_tmp_video_properties
+):
+    video = Video(fixture_tmp_video_filepath)
+    prepared = BaseRequest(stop_time=1).validate().prepare(video)
+
+    assert prepared.__class__ is PreparedBaseRequest
+    assert prepared.is_prepared
+    assert prepared.start_time == 0
+    assert prepared.fps == fixture_tmp_video_properties["fps"]
+    assert prepared.extraction_range["start_second"] == 0.0
+    assert prepared.extraction_range["stop_second"] == 1.0
+
+
+def test_prepared_base_request_resolves_its_own_prepare_steps():
+    steps = PreparedBaseRequest._prepare_steps
+    assert [step.__name__ for step in steps] == list(PreparedBaseRequest.PREPARE_ORDER)
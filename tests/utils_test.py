@@ -1,7 +1,9 @@
 import json
-from dataclasses import dataclass
+import sys
+from dataclasses import asdict, dataclass
 from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -16,6 +18,7 @@ from videoxt.utils import (
     enumerate_dir,
     enumerate_filepath,
     parse_kwargs,
+    remove_private_keys,
     seconds_to_timestamp,
     timedelta_to_timestamp,
     timestamp_to_seconds,
@@ -79,6 +82,12 @@ def test_timestamp_to_seconds_invalid_input():
         timestamp_to_seconds("invalid")
 
 
+def test_timestamp_to_seconds_too_many_parts():
+    """Test that the function raises a ValueError for more than three parts."""
+    with pytest.raises(ValueError):
+        timestamp_to_seconds("1:00:00:00")
+
+
 def test_timestamp_to_seconds_empty_string():
     """Test that the function raises a ValueError if the input is an empty string."""
     with pytest.raises(ValueError):
@@ -129,6 +138,14 @@ def test_seconds_to_timestamp_valid_input():
     assert seconds_to_timestamp(3661.999) == "1:01:01"
 
 
+def test_seconds_to_timestamp_days():
+    """Test that durations of a day or more match `str(timedelta)`."""
+    assert seconds_to_timestamp(86399) == "23:59:59"
+    assert seconds_to_timestamp(86400) == "1 day, 0:00:00"
+    assert seconds_to_timestamp(90061.5) == "1 day, 1:01:01"
+    assert seconds_to_timestamp(172800) == "2 days, 0:00:00"
+
+
 def test_seconds_to_timestamp_invalid_input():
     """Test that the function raises a TypeError if the input is not a numeric value."""
     with pytest.raises(TypeError):
@@ -173,6 +190,40 @@ def test_enumerate_filepath_new_file(fixture_tmp_text_filepath: Path):
     assert enumerate_filepath(expected_path) == expected_path
 
 
+def test_enumerate_filepath_resumes_existing_enumeration(tmp_path: Path):
+    """Test that an already enumerated filepath resumes past its current index."""
+    filepath = tmp_path / "test (57).txt"
+    filepath.touch()
+    assert enumerate_filepath(filepath) == tmp_path / "test (58).txt"
+
+    tagged_filepath = tmp_path / "test_vxt (2).txt"
+    tagged_filepath.touch()
+    assert enumerate_filepath(tagged_filepath, tag="_vxt") == (
+        tmp_path / "test_vxt (3).txt"
+    )
+
+
+@pytest.mark.parametrize("taken", [1, 2, 3, 10, 37])
+def test_enumerate_filepath_skips_consecutive_collisions(tmp_path: Path, taken: int):
+    """Test that the first index after a run of existing enumerations is returned."""
+    filepath = tmp_path / "test.txt"
+    filepath.touch()
+    for index in range(1, taken + 1):
+        (tmp_path / f"test ({index}).txt").touch()
+
+    assert enumerate_filepath(filepath) == tmp_path / f"test ({taken + 1}).txt"
+
+
+def test_enumerate_filepath_reuses_the_lowest_free_index(tmp_path: Path):
+    """Test that a gap in the existing enumerations is filled before the end."""
+    filepath = tmp_path / "t.txt"
+    filepath.touch()
+    for index in (*range(1, 4), *range(5, 9)):
+        (tmp_path / f"t ({index}).txt").touch()
+
+    assert enumerate_filepath(filepath) == tmp_path / "t (4).txt"
+
+
 @dataclass
 class Image:
     """Test dataclass for the `utils.parse_kwargs` function."""
@@ -433,3 +484,65 @@ def test_to_json_mixin_to_json_skip_private_keys_is_true():
     test_obj = TestClass("c", 4)
     expected_json = '{\n  "a": "c",\n  "b": 4\n}'
     assert test_obj.json(skip_private_keys=True) == expected_json
+
+
+@pytest.mark.parametrize("skip_private_keys", [True, False])
+def test_to_json_mixin_to_json_nested_dataclass(skip_private_keys: bool):
+    """Test that nested dataclasses are serialized like `dataclasses.asdict` would."""
+
+    @dataclass
+    class Inner:
+        a: int
+        _private: int = 1
+
+    @dataclass
+    class Outer(ToJsonMixin):
+        inner: Inner
+        values: list[int]
+        mapping: dict[str, Any]
+        _private: int = 2
+
+    test_obj = Outer(Inner(1), [1, 2], {"b": 3, "_c": 4})
+    d = asdict(test_obj)
+    expected_json = json.dumps(
+        remove_private_keys(d) if skip_private_keys else d, indent=2
+    )
+    assert test_obj.json(skip_private_keys=skip_private_keys) == expected_json
+
+
+def test_remove_private_keys_nested():
+    """Test that private keys are removed at every level of a nested dictionary."""
+    d = {"a": 1, "_b": 2, "c": {"d": 3, "_e": 4, "f": {"_g": 5, "h": 6}}}
+    assert remove_private_keys(d) == {"a": 1, "c": {"d": 3, "f": {"h": 6}}}
+
+
+def test_remove_private_keys_deeply_nested():
+    """Test that nesting deeper than the recursion limit is handled."""
+    d: dict = {}
+    inner = d
+    depth = sys.getrecursionlimit() + 100
+    for _ in range(depth):
+        inner["x"], inner["_y"] = {}, 0
+        inner = inner["x"]
+
+    result = remove_private_keys(d)
+    for _ in range(depth):
+        assert list(result) == ["x"]
+        result = result["x"]
+    assert result == {}
+
+
+def test_to_json_mixin_verbose_print(capsys: pytest.CaptureFixture[str]):
+    """Test that `verbose_print` writes the title and the public JSON keys."""
+
+    @dataclass
+    class Example(ToJsonMixin):
+        name: str
+        _private: int = 0
+
+    Example("test").verbose_print(title="Example")
+    out = capsys.readouterr().out
+    title, body = out.split("\n", 1)
+
+    assert title == "<Example>"
+    assert json.loads(body) == {"name": "test"}
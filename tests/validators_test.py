@@ -1,3 +1,5 @@
+import itertools
+import re
 from pathlib import Path
 
 import pytest
@@ -7,10 +9,12 @@ from videoxt.exceptions import ValidationError
 from videoxt.validators import (
     non_negative_float,
     non_negative_int,
+    path_check_cache,
     positive_float,
     positive_int,
     valid_audio_format,
     valid_dimensions,
+    valid_dimensions_str,
     valid_dir,
     valid_extraction_range,
     valid_filename,
@@ -101,6 +105,26 @@ def test_positive_int_none():
         positive_int(None)
 
 
+def test_positive_int_unhashable():
+    with pytest.raises(ValidationError):
+        positive_int([42])
+
+
+def test_positive_int_repeated_invalid_input_raises_every_time():
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            positive_int("abc")
+
+
+def test_positive_int_and_non_negative_int_digit_strings():
+    assert positive_int("0042") == 42
+    assert non_negative_int("0") == 0
+    with pytest.raises(ValidationError):
+        positive_int("0")
+    with pytest.raises(ValidationError):
+        positive_int("\u00b2")
+
+
 def test_positive_float_valid_float():
     assert positive_float(3.14) == 3.14
 
@@ -578,6 +602,20 @@ def test_valid_timestamp_invalid(timestamp: str):
         valid_timestamp(timestamp)
 
 
+def test_valid_timestamp_agrees_with_reference_regex():
+    # The pattern `valid_timestamp` used before it was hand-parsed, kept as an oracle.
+    reference = re.compile(r"^([0-9]|[0-5][0-9])(:[0-5][0-9]){1,2}$")
+    for length in range(1, 9):
+        for chars in itertools.product("069:", repeat=length):
+            timestamp = "".join(chars)
+            try:
+                valid_timestamp(timestamp)
+                accepted = True
+            except ValidationError:
+                accepted = False
+            assert accepted == bool(reference.match(timestamp)), timestamp
+
+
 def test_valid_audio_format_valid_audio_formats():
     for audio_format in C.SUPPORTED_AUDIO_FORMATS:
         assert valid_audio_format(audio_format) == audio_format
@@ -790,6 +828,13 @@ def test_valid_stop_time_raises_validation_error_with_none():
         valid_stop_time(None)
 
 
+def test_valid_start_and_stop_time_raise_validation_error_with_non_numeric_types():
+    with pytest.raises(ValidationError):
+        valid_start_time([1])
+    with pytest.raises(ValidationError):
+        valid_stop_time(object())
+
+
 def test_valid_video_filepath_with_supported_existing_filepath(
     fixture_tmp_video_filepath,
 ):
@@ -871,6 +916,12 @@ def test_valid_volume_with_valid_volume():
     assert valid_volume("3.0") == 3.0
 
 
+def test_valid_volume_always_returns_float():
+    assert isinstance(valid_volume(2), float)
+    assert isinstance(valid_volume(-1), float)
+    assert isinstance(valid_volume("2"), float)
+
+
 def test_valid_volume_with_invalid_input():
     with pytest.raises(ValidationError):
         valid_volume("abc")
@@ -880,3 +931,50 @@ def test_valid_volume_with_invalid_input():
         valid_volume("")
     with pytest.raises(ValidationError):
         valid_volume(" ")
+
+
+def test_valid_dimensions_str_valid():
+    assert valid_dimensions_str("1920x1080") == (1920, 1080)
+
+
+@pytest.mark.parametrize("dimensions", ["", "1920", "1920x", "x1080", "1x2x3", "axb"])
+def test_valid_dimensions_str_invalid(dimensions: str):
+    with pytest.raises(ValidationError):
+        valid_dimensions_str(dimensions)
+
+
+def test_valid_filepath_is_not_cached_across_calls(tmp_path: Path):
+    filepath = tmp_path / "cached.txt"
+    filepath.touch()
+    assert valid_filepath(filepath) == filepath
+
+    filepath.unlink()
+    filepath.mkdir()
+    with pytest.raises(ValidationError):
+        valid_filepath(filepath)
+
+
+def test_valid_dir_relative_path_follows_chdir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    (tmp_path / "a" / "sub").mkdir(parents=True)
+    (tmp_path / "b").mkdir()
+
+    with path_check_cache():
+        monkeypatch.chdir(tmp_path / "a")
+        assert valid_dir("sub") == Path("sub")
+        monkeypatch.chdir(tmp_path / "b")
+        with pytest.raises(ValidationError):
+            valid_dir("sub")
+
+
+def test_path_check_cache_is_scoped_to_the_block(tmp_path: Path):
+    filepath = tmp_path / "cached.txt"
+    filepath.touch()
+    with path_check_cache():
+        assert valid_filepath(filepath) == filepath
+        filepath.unlink()
+        assert valid_filepath(filepath) == filepath
+
+    with pytest.raises(ValidationError):
+        valid_filepath(filepath)
@@ -21,6 +21,11 @@ def test_open_video_capture_if_filepath_as_str_and_is_valid_video_file(
         assert isinstance(opencap, cv2.VideoCapture)
 
 
+def test_open_video_capture_uses_the_ffmpeg_backend(fixture_tmp_video_filepath):
+    with open_video_capture(fixture_tmp_video_filepath) as opencap:
+        assert opencap.getBackendName() == "FFMPEG"
+
+
 def test_open_video_capture_if_filepath_is_none():
     with pytest.raises(ClosedVideoCaptureError):
         with open_video_capture(None) as opencap:
@@ -101,6 +106,19 @@ def test_video_object_attributes_match_expected_values(
     )
 
 
+def test_video_object_reads_has_audio_on_first_access(fixture_tmp_video_filepath):
+    video = Video(fixture_tmp_video_filepath)
+    assert "has_audio" not in vars(video)
+    assert video.has_audio is True
+    assert vars(video)["has_audio"] is True
+
+
+def test_videos_with_the_same_dimensions_share_the_tuple(fixture_tmp_video_filepath):
+    first = Video(fixture_tmp_video_filepath)
+    second = Video(fixture_tmp_video_filepath)
+    assert first.dimensions is second.dimensions
+
+
 def test_video_object_with_invalid_filepath_raises_cv2_error(
     fixture_tmp_video_filepath_zero_seconds,
 ):
@@ -167,3 +185,22 @@ def test_fetch_video_properties_with_invalid_filepath_raises_cv2_error(
 ):
     with pytest.raises(ClosedVideoCaptureError):
         fetch_video_properties(fixture_tmp_video_filepath_zero_seconds)
+
+
+def test_fetch_video_properties_returns_a_fresh_dict_for_a_cached_file(
+    fixture_tmp_video_filepath, fixture_tmp_video_properties
+):
+    first = fetch_video_properties(fixture_tmp_video_filepath)
+    first["fps"] = None
+    second = fetch_video_properties(fixture_tmp_video_filepath)
+    assert second is not first
+    assert second["fps"] == fixture_tmp_video_properties["fps"]
+
+
+def test_fetch_video_properties_with_stat_result_matches_without(
+    fixture_tmp_video_filepath,
+):
+    stat_result = fixture_tmp_video_filepath.stat()
+    assert fetch_video_properties(
+        fixture_tmp_video_filepath, stat_result=stat_result
+    ) == fetch_video_properties(fixture_tmp_video_filepath)
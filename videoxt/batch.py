@@ -0,0 +1,91 @@
+"""Contains helpers for probing many videos and preparing many requests in parallel."""
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import videoxt.validators as V
+from videoxt.requesters import PreparedRequest, Request
+from videoxt.video import Video
+
+
+def probe_all(
+    filepaths: Iterable[Path | str], max_workers: int | None = None
+) -> list[Video]:
+    """
+    Construct a validated `Video` for each filepath, probing the files concurrently.
+
+    Probing is dominated by OpenCV and ffmpeg reading the files, which release the
+    GIL, so threads overlap the I/O without the pickling cost of worker processes.
+
+    Usage:
+    -----
+    ```python
+    >>> from videoxt.batch import probe_all
+    >>> videos = probe_all(["path/to/video1.mp4", "path/to/video2.mp4"])
+    >>> [video.duration_timestamp for video in videos]
+    ['0:01:05', '0:12:34']
+    ```
+
+    Args:
+    -----
+        `filepaths` (Iterable[Path | str]):
+            Paths to the video files.
+        `max_workers` (int | None):
+            Maximum number of threads. Defaults to `ThreadPoolExecutor`'s default.
+
+    Returns:
+    -----
+        `list[Video]`: The videos, in the same order as `filepaths`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_probe_one, filepaths))
+
+
+def _probe_one(filepath: Path | str) -> Video:
+    """Probe and validate a single video."""
+    return Video(Path(filepath))
+
+
+def prepare_all(
+    jobs: Iterable[tuple[Path | str, Request]], max_workers: int | None = None
+) -> list[PreparedRequest]:
+    """
+    Validate and prepare many requests across worker processes.
+
+    Each job pairs a video filepath with the request to prepare for it. Probing the
+    video and validating the request (filesystem checks, reading video properties) are
+    independent per job, so they are fanned out to a `ProcessPoolExecutor`.
+
+    Usage:
+    -----
+    ```python
+    >>> from videoxt.batch import prepare_all
+    >>> from videoxt.requesters import FramesRequest, GifRequest
+    >>> prepared = prepare_all(
+    ...     [
+    ...         ("path/to/video1.mp4", FramesRequest(capture_rate=30)),
+    ...         ("path/to/video2.mp4", GifRequest(stop_time=2)),
+    ...     ]
+    ... )
+    ```
+
+    Args:
+    -----
+        `jobs` (Iterable[tuple[Path | str, Request]]):
+            Pairs of (video filepath, request) to prepare.
+        `max_workers` (int | None):
+            Maximum number of worker processes. Defaults to the number of processors.
+
+    Returns:
+    -----
+        `list[PreparedRequest]`: The prepared requests, in the same order as `jobs`.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_prepare_one, jobs))
+
+
+def _prepare_one(job: tuple[Path | str, Request]) -> PreparedRequest:
+    """Probe the video, then validate and prepare the request for it."""
+    filepath, request = job
+    with V.path_check_cache():
+        return request.validate().prepare(Video(Path(filepath)))
@@ -9,6 +9,49 @@ from moviepy.editor import VideoFileClip, vfx
 import videoxt.constants as C
 
 
+class BufferPool:
+    """
+    Store preallocated `np.ndarray` buffers for reuse across frames.
+
+    Buffers are keyed by `(tag, shape, dtype)`, where the tag names the editing stage
+    the buffer is used for. Keeping stages apart prevents an operation from writing
+    into the array it is reading from when two stages share a shape.
+
+    Public Methods:
+    -----
+        `get(tag, shape, dtype)` -> `np.ndarray`:
+            Return a reusable buffer, allocating it on first request.
+    """
+
+    def __init__(self) -> None:
+        self._buffers: dict[tuple[str, tuple[int, ...], Any], np.ndarray[Any, Any]] = {}
+
+    def get(
+        self, tag: str, shape: tuple[int, ...], dtype: Any = np.uint8
+    ) -> np.ndarray[Any, Any]:
+        """
+        Return a reusable buffer for the given stage, shape and dtype.
+
+        Args:
+        -----
+            `tag` (str):
+                Name of the stage the buffer is used for (Ex: 'resize').
+            `shape` (tuple[int, ...]):
+                Shape of the buffer.
+            `dtype` (Any):
+                Data type of the buffer. Defaults to `np.uint8`.
+
+        Returns:
+        -----
+            `np.ndarray[Any, Any]`: An uninitialized buffer of the requested shape.
+        """
+        key = (tag, shape, np.dtype(dtype))
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = np.empty(shape, dtype)
+        return buffer
+
+
 def trim_clip(
     clip: VideoFileClip,
     start_second: float | None = None,
@@ -153,11 +196,16 @@ def edit_image(
     dimensions: tuple[int, int] | None = None,
     rotate: int | None = None,
     monochrome: bool | None = None,
+    pool: BufferPool | None = None,
 ) -> np.ndarray[Any, Any]:
     """
     Edit a numpy.ndarray image by resizing, rotating, and converting to monochrome
     if specified and return the edited image.
 
+    If a `BufferPool` is provided, each edit writes into a buffer reused across calls
+    instead of allocating a new array. The returned image is then only valid until the
+    next call made with the same pool.
+
     Args:
     -----
         `image` (np.ndarray[Any, Any]):
@@ -170,13 +218,21 @@ def edit_image(
         `monochrome` (bool | None):
             Whether to convert the image to monochrome. If None, the black and white
             filter will not be applied.
+        `pool` (BufferPool | None):
+            Optional pool of output buffers to reuse. If None, new arrays are allocated.
 
     Returns:
     -----
         `np.ndarray[Any, Any]`: The edited image.
     """
     if dimensions is not None and dimensions != image.shape:
-        image = cv2.resize(image, dimensions)
+        if pool is None:
+            image = cv2.resize(image, dimensions)
+        else:
+            shape = (dimensions[1], dimensions[0], *image.shape[2:])
+            image = cv2.resize(
+                image, dimensions, dst=pool.get("resize", shape, image.dtype)
+            )
 
     if rotate != 0 and rotate is not None:
         try:
@@ -184,9 +240,27 @@ def edit_image(
         except KeyError:
             pass  # XXX: log
         else:
-            image = cv2.rotate(image, rotate_value)
+            if pool is None:
+                image = cv2.rotate(image, rotate_value)
+            else:
+                shape = (
+                    image.shape
+                    if rotate == 180
+                    else (image.shape[1], image.shape[0], *image.shape[2:])
+                )
+                image = cv2.rotate(
+                    image, rotate_value, dst=pool.get("rotate", shape, image.dtype)
+                )
 
     if monochrome:
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if pool is None:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        else:
+            shape = image.shape[:2]
+            image = cv2.cvtColor(
+                image,
+                cv2.COLOR_BGR2GRAY,
+                dst=pool.get("monochrome", shape, image.dtype),
+            )
 
     return image
@@ -1,6 +1,6 @@
 """This module contains extractor objects that perform extractions."""
 from collections.abc import Generator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -242,6 +242,7 @@ class FramesExtractor:  # XXX: Optimize.
     """
 
     request: R.PreparedFramesRequest
+    _bufpool: E.BufferPool = field(init=False, default_factory=E.BufferPool, repr=False)
 
     def __post_init__(self) -> None:
         """Prepare the request if it has yet to be prepared."""
@@ -384,7 +385,10 @@ class FramesExtractor:  # XXX: Optimize.
 
         read_successful: bool
         frame: np.ndarray[Any, Any]
-        read_successful, frame = opencap.read()
+        width, height = self.request.video.dimensions
+        read_successful, frame = opencap.read(
+            self._bufpool.get("read", (height, width, 3))
+        )
         if not read_successful:
             raise FrameReadError(
                 f"Could not read frame {frame_num} from video capture."
@@ -405,7 +409,11 @@ class FramesExtractor:  # XXX: Optimize.
             `np.ndarray[Any, Any]`: The edited video frame.
         """
         return E.edit_image(
-            frame, self.request.dimensions, self.request.rotate, self.request.monochrome
+            frame,
+            self.request.dimensions,
+            self.request.rotate,
+            self.request.monochrome,
+            pool=self._bufpool,
         )
 
     def _write_image(
@@ -8,6 +8,7 @@ from typing import Any
 
 from rich.console import Console
 
+import videoxt.validators as V
 from videoxt.constants import ExtractionMethod
 from videoxt.exceptions import VideoXTError
 from videoxt.extractors import (
@@ -79,10 +80,13 @@ class ExtractionHandler:
         -----
             `Result`: A dataclass containing the extraction details.
         """
-        video = self.object_factory.make_video(filepath)
-        request = self.object_factory.make_prepared_request(
-            video, options, skip_validation
-        )
+        # Paths are stat()ed at most once while the video and request are validated;
+        # the cache ends before anything is written.
+        with V.path_check_cache():
+            video = self.object_factory.make_video(filepath)
+            request = self.object_factory.make_prepared_request(
+                video, options, skip_validation
+            )
         extractor = self.object_factory.make_extractor(request)
         result = self.object_factory.make_result()
 
@@ -137,7 +141,7 @@ class ExtractionHandler:
 
         finally:
             if extractor.request.destpath.exists():
-                result.destpath = extractor.request.destpath
+                result.destpath = extractor.request.destpath.resolve().as_posix()
 
             result.elapsed_time = perf_counter() - _timer_start
             return result
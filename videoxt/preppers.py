@@ -1,5 +1,6 @@
 """Contains functions, objects that prepare shared request values for extraction."""
 import math
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -302,7 +303,7 @@ def prepare_destpath(
         prepared_suffix if prepared_suffix.startswith(".") else f".{prepared_suffix}"
     )
     filename = f"{request_filename or video_filepath.stem}{suffix}"
-    dest_path = base_dir / filename
+    dest_path = Path(os.path.join(base_dir, filename))
 
     if prepared_overwrite is True and dest_path != video_filepath:
         return dest_path
@@ -388,12 +389,12 @@ def prepare_destpath_frames(
     if request_destdir is not None and request_destdir != video_filepath:
         return request_destdir
 
-    default_destdir = video_filepath.parent / video_filepath.name
-
     if prepared_overwrite is True:
-        return default_destdir.with_name(f"{video_filepath.name}_frames")
+        return Path(f"{os.fspath(video_filepath)}_frames")
 
-    return U.enumerate_dir(default_destdir, tag="_frames")
+    # The video file itself always exists, so this yields '<video name>_frames' or an
+    # enumerated variant of it.
+    return U.enumerate_dir(video_filepath, tag="_frames")
 
 
 def prepare_images_expected(
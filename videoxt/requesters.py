@@ -1,8 +1,9 @@
 """Contains Request models that validate and prepare a request for extraction."""
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, TypeVar
 
 import videoxt.preppers as P
 import videoxt.validators as V
@@ -10,6 +11,8 @@ from videoxt.exceptions import NoAudioError
 from videoxt.utils import ToJsonMixin
 from videoxt.video import Video
 
+_PreparedBaseRequestT = TypeVar("_PreparedBaseRequestT", bound="PreparedBaseRequest")
+
 
 @dataclass
 class Request(ABC):
@@ -889,14 +892,35 @@ class PreparedBaseRequest(PreparedRequest):
     extraction_range: dict[str, Any] = field(init=False, default_factory=dict)
     _is_prepared: bool = field(init=False)
 
-    def prepare(self) -> "PreparedBaseRequest":
-        """Prepare fields and return a `PreparedBaseRequest`."""
-        self._prepare_start_time()
-        self._prepare_stop_time()
-        self._prepare_fps()
-        self._prepare_extraction_range()
-        self._prepare_verbose()
-        self._prepare_overwrite()
+    PREPARE_ORDER: ClassVar[tuple[str, ...]] = (
+        "_prepare_start_time",
+        "_prepare_stop_time",
+        "_prepare_fps",
+        "_prepare_extraction_range",
+        "_prepare_verbose",
+        "_prepare_overwrite",
+    )
+    _prepare_steps: ClassVar[tuple[Callable[[Any], Any], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the methods named in `PREPARE_ORDER` once, at class creation."""
+        super().__init_subclass__(**kwargs)
+        cls._resolve_prepare_steps()
+
+    @classmethod
+    def _resolve_prepare_steps(cls) -> None:
+        """Set `_prepare_steps` to the methods named in `PREPARE_ORDER`, in order."""
+        cls._prepare_steps = tuple(getattr(cls, name) for name in cls.PREPARE_ORDER)
+
+    def prepare(self: _PreparedBaseRequestT) -> _PreparedBaseRequestT:
+        """
+        Prepare fields and return the prepared request.
+
+        Runs the `_prepare_*` steps listed in the class's `PREPARE_ORDER`, in order.
+        """
+        for step in self._prepare_steps:
+            step(self)
+        self._is_prepared = True
         return self
 
     @property
@@ -951,6 +975,11 @@ class PreparedBaseRequest(PreparedRequest):
         return self.overwrite
 
 
+# `__init_subclass__` only runs for subclasses; `BaseRequest.prepare` instantiates
+# `PreparedBaseRequest` itself, so its own steps are resolved here.
+PreparedBaseRequest._resolve_prepare_steps()
+
+
 @dataclass
 class PreparedAudioRequest(PreparedBaseRequest):
     """
@@ -1031,22 +1060,19 @@ class PreparedAudioRequest(PreparedBaseRequest):
     volume: float | None = None
     normalize: bool | None = None
 
-    def prepare(self) -> "PreparedAudioRequest":
-        """
-        Prepare request fields and return a `PreparedAudioRequest`, required by an
-        `AudioExtractor`.
-        """
-        self._check_video_has_audio()
-        super().prepare()
-        self._prepare_audio_format()
-        self._prepare_destpath()
-        self._prepare_speed()
-        self._prepare_bounce()
-        self._prepare_reverse()
-        self._prepare_volume()
-        self._prepare_normalize()
-        self._is_prepared = True
-        return self
+    PREPARE_ORDER: ClassVar[tuple[str, ...]] = (
+        ("_check_video_has_audio",)
+        + PreparedBaseRequest.PREPARE_ORDER
+        + (
+            "_prepare_audio_format",
+            "_prepare_destpath",
+            "_prepare_speed",
+            "_prepare_bounce",
+            "_prepare_reverse",
+            "_prepare_volume",
+            "_prepare_normalize",
+        )
+    )
 
     def _check_video_has_audio(self) -> None:
         """Raise `NoAudioError` if the video does not have audio."""
@@ -1195,24 +1221,18 @@ class PreparedClipRequest(PreparedBaseRequest):
     volume: float | None = None
     normalize: bool | None = None
 
-    def prepare(self) -> "PreparedClipRequest":
-        """
-        Prepare request fields and return a `PreparedClipRequest`, required by a
-        `ClipExtractor`.
-        """
-        super().prepare()
-        self._prepare_destpath()
-        self._prepare_resize()
-        self._prepare_dimensions()
-        self._prepare_rotate()
-        self._prepare_speed()
-        self._prepare_bounce()
-        self._prepare_reverse()
-        self._prepare_monochrome()
-        self._prepare_volume()
-        self._prepare_normalize()
-        self._is_prepared = True
-        return self
+    PREPARE_ORDER: ClassVar[tuple[str, ...]] = PreparedBaseRequest.PREPARE_ORDER + (
+        "_prepare_destpath",
+        "_prepare_resize",
+        "_prepare_dimensions",
+        "_prepare_rotate",
+        "_prepare_speed",
+        "_prepare_bounce",
+        "_prepare_reverse",
+        "_prepare_monochrome",
+        "_prepare_volume",
+        "_prepare_normalize",
+    )
 
     def _prepare_destpath(self) -> Path:
         """Set the destination path the extracted clip will be saved to."""
@@ -1361,23 +1381,17 @@ class PreparedFramesRequest(PreparedBaseRequest):
     monochrome: bool | None = None
     images_expected: int = field(init=False)
 
-    def prepare(self) -> "PreparedFramesRequest":
-        """
-        Prepare request fields and return a `PreparedFramesRequest`, required by a
-        `FramesExtractor`.
-        """
-        super().prepare()
-        self._prepare_destpath()
-        self._prepare_filename()
-        self._prepare_image_format()
-        self._prepare_capture_rate()
-        self._prepare_resize()
-        self._prepare_dimensions()
-        self._prepare_rotate()
-        self._prepare_monochrome()
-        self._prepare_images_expected()
-        self._is_prepared = True
-        return self
+    PREPARE_ORDER: ClassVar[tuple[str, ...]] = PreparedBaseRequest.PREPARE_ORDER + (
+        "_prepare_destpath",
+        "_prepare_filename",
+        "_prepare_image_format",
+        "_prepare_capture_rate",
+        "_prepare_resize",
+        "_prepare_dimensions",
+        "_prepare_rotate",
+        "_prepare_monochrome",
+        "_prepare_images_expected",
+    )
 
     def _prepare_destpath(self) -> Path:
         """Set the directory the extracted images will be saved to."""
@@ -1519,22 +1533,16 @@ class PreparedGifRequest(PreparedBaseRequest):
     reverse: bool | None = None
     monochrome: bool | None = None
 
-    def prepare(self) -> "PreparedGifRequest":
-        """
-        Prepare request fields and return a `PreparedGifRequest`, required by a
-        `GifExtractor`.
-        """
-        super().prepare()
-        self._prepare_destpath()
-        self._prepare_resize()
-        self._prepare_dimensions()
-        self._prepare_rotate()
-        self._prepare_speed()
-        self._prepare_bounce()
-        self._prepare_monochrome()
-        self._prepare_reverse()
-        self._is_prepared = True
-        return self
+    PREPARE_ORDER: ClassVar[tuple[str, ...]] = PreparedBaseRequest.PREPARE_ORDER + (
+        "_prepare_destpath",
+        "_prepare_resize",
+        "_prepare_dimensions",
+        "_prepare_rotate",
+        "_prepare_speed",
+        "_prepare_bounce",
+        "_prepare_monochrome",
+        "_prepare_reverse",
+    )
 
     def _prepare_destpath(self) -> Path:
         """Set the destination path the extracted clip will be saved to."""
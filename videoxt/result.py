@@ -5,7 +5,7 @@ from pathlib import Path
 from videoxt.utils import ToJsonMixin
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ToJsonMixin):
     """
     A container for the result of an extraction.
@@ -18,11 +18,18 @@ class Result(ToJsonMixin):
             The name of the method that was called.
         `message` (str | None):
             A message describing the result of the extraction.
-        `destpath` (Path | None):
-            The path to the destination file or directory.
+        `destpath` (str | None):
+            The resolved path to the destination file or directory as a POSIX
+            string, e.g. 'C:/Users/me/MyVideo.mp4_frames' on Windows. This is the
+            same form `json()` emitted when the field held a `Path`; use
+            `destpath_path` when `Path` semantics are needed.
         `elapsed_time` (float | None):
             The number of seconds it took to complete the extraction.
 
+    Properties:
+    -----
+        - `destpath_path` -> `Path | None`: The destination path as a `Path`.
+
     Methods:
     -----
         - `json()` -> `str`: Return a JSON string representation of the request.
@@ -31,5 +38,10 @@ class Result(ToJsonMixin):
     success: bool | None = None
     method: str | None = None
     message: str | None = None
-    destpath: Path | None = None
+    destpath: str | None = None
     elapsed_time: float | None = None
+
+    @property
+    def destpath_path(self) -> Path | None:
+        """Return the destination path as a `Path`, or None if not set."""
+        return Path(self.destpath) if self.destpath else None
@@ -1,8 +1,12 @@
 """Utility functions and classes used throughout the library."""
 import json
-from collections import defaultdict
-from dataclasses import asdict, dataclass
+import os
+import re
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar, Protocol
 
@@ -11,13 +15,21 @@ from rich import print
 from videoxt.constants import ExtractionMethod
 from videoxt.validators import positive_float, positive_int, valid_filename
 
+# Up to three ':' separated integers (hours only when minutes are present), followed by
+# an optional fractional part that is ignored.
+_TIMESTAMP_RE = re.compile(r"(?:(?:(\d+):)?(\d+):)?(\d+)(?:\..*)?", re.DOTALL)
 
+# A trailing " (N)" enumeration suffix, as produced by `append_enumeration`.
+_ENUMERATION_SUFFIX_RE = re.compile(r"^(.*?) \((\d+)\)$")
+
+
+@lru_cache(maxsize=1024)
 def timestamp_to_seconds(timestamp: str) -> float:
     """
     Convert a timestamp string to the total number of seconds (float) it represents.
 
     Accepts the formats "HH:MM:SS", "H:MM:SS", "MM:SS", "M:SS", "SS" or "S".
-    Microseconds are truncated.
+    Microseconds are truncated. Results are memoized.
 
     Usage:
     -----
@@ -42,14 +54,20 @@ def timestamp_to_seconds(timestamp: str) -> float:
     Returns:
     -----
         `float`: The number of seconds converted from the timestamp string.
+
+    Raises:
+    -----
+        `ValueError`: If the timestamp is not in one of the accepted formats.
     """
-    timestamp = timestamp.split(".")[0]
-    time_parts = timestamp.split(":")
-    total_seconds: float = sum(
-        float(part) * 60**exponent for exponent, part in enumerate(reversed(time_parts))
-    )
+    match = _TIMESTAMP_RE.fullmatch(timestamp)
+    if match is None:
+        raise ValueError(f"Invalid timestamp: {timestamp!r}")
 
-    return total_seconds
+    hours, minutes, seconds = match.groups()
+    # Horner-style accumulation: one multiply per part, all in integer arithmetic.
+    total = int(hours) if hours else 0
+    total = total * 60 + (int(minutes) if minutes else 0)
+    return float(total * 60 + int(seconds))
 
 
 def seconds_to_timestamp(seconds: float) -> str:
@@ -83,7 +101,36 @@ def seconds_to_timestamp(seconds: float) -> str:
     if seconds <= 0:
         return "0:00:00"
 
-    return str(timedelta(seconds=int(seconds)))
+    whole_seconds = int(seconds)
+    if whole_seconds < 3600:
+        return _SUB_HOUR_TIMESTAMPS[whole_seconds]
+
+    return _whole_seconds_to_timestamp(whole_seconds)
+
+
+@lru_cache(maxsize=1024)
+def _whole_seconds_to_timestamp(seconds: int) -> str:
+    """
+    Format whole seconds as "H:MM:SS", memoized on the truncated integer value.
+
+    Matches `str(datetime.timedelta(seconds=seconds))`, including the "N day(s), "
+    prefix for durations of 24 hours or more, without building a timedelta.
+    """
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+    timestamp = f"{hours}:{minutes:02d}:{secs:02d}"
+
+    if days:
+        return f"{days} day{'s' if days != 1 else ''}, {timestamp}"
+
+    return timestamp
+
+
+# Precomputed "0:MM:SS" strings for the first hour, the range progress reporting hits.
+_SUB_HOUR_TIMESTAMPS = tuple(
+    f"0:{minutes:02d}:{secs:02d}" for minutes in range(60) for secs in range(60)
+)
 
 
 def timedelta_to_timestamp(duration: timedelta) -> str:
@@ -116,17 +163,17 @@ def timedelta_to_timestamp(duration: timedelta) -> str:
     -----
         `ValueError`: If the duration is negative.
     """
-    total_seconds = duration.total_seconds()
-
-    if total_seconds < 0:
+    if duration.days < 0:
         raise ValueError(
             f"Invalid duration: timedelta must be non-negative: {duration}"
         )
 
+    # timedelta stores normalized integer days and seconds, so no float is needed.
+    total_seconds = duration.days * 86400 + duration.seconds
     hours, remainder = divmod(total_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
 
-    return f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}"
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
 def append_enumeration(index: int, tag: str | None = None) -> str:
@@ -207,15 +254,20 @@ def enumerate_dir(directory: Path, tag: str | None = None) -> Path:
     -----
         `Path`: The path to a non-existent directory.
     """
-    if not directory.exists():
+    if not os.path.exists(directory):
         return directory
 
-    index = 1
+    if tag is not None:
+        tag = valid_filename(tag)
+
+    parent = os.fspath(directory.parent)
+    siblings = _sibling_names(parent)
+    base_name, index = _split_enumeration(directory.name, tag)
+
     while True:
-        append_str = append_enumeration(index, tag=tag)
-        new_dir = directory.with_name(f"{directory.name}{append_str}")
-        if not new_dir.exists():
-            return new_dir
+        new_name = f"{base_name}{append_enumeration(index, tag=tag)}"
+        if not _name_exists(parent, new_name, siblings):
+            return Path(os.path.join(parent, new_name))
         index += 1
 
 
@@ -248,21 +300,75 @@ def enumerate_filepath(filepath: Path, tag: str | None = None) -> Path:
     -----
         `Path`: The path to a non-existent file.
     """
-    if not filepath.exists():
+    if not os.path.exists(filepath):
         return filepath
 
-    index = 1
+    if tag is not None:
+        tag = valid_filename(tag)
+
+    parent = os.fspath(filepath.parent)
+    siblings = _sibling_names(parent)
+    base_stem, index = _split_enumeration(filepath.stem, tag)
+
     while True:
         append_str = append_enumeration(index, tag)
-        new_filename = f"{filepath.stem}{append_str}{filepath.suffix}"
-        new_filepath = filepath.with_name(new_filename)
+        new_filename = f"{base_stem}{append_str}{filepath.suffix}"
 
-        if not new_filepath.exists():
-            return new_filepath
+        if not _name_exists(parent, new_filename, siblings):
+            return Path(os.path.join(parent, new_filename))
 
         index += 1
 
 
+def _split_enumeration(name: str, tag: str | None = None) -> tuple[str, int]:
+    """
+    Split an already enumerated name into its base name and the next index to try.
+
+    Names produced by `append_enumeration` (e.g. 'test (57)' or 'test_vxt (2)') are
+    parsed so the search resumes past the existing index instead of starting at 1.
+    Names without an enumeration suffix are returned unchanged with an index of 1.
+    """
+    match = _ENUMERATION_SUFFIX_RE.match(name)
+    if match is not None:
+        base, index = match.group(1), int(match.group(2))
+        if tag is None:
+            return base, index + 1
+        if tag and base.endswith(tag) and base != tag:
+            return base[: -len(tag)], index + 1
+
+    if tag and name.endswith(tag) and name != tag:
+        return name[: -len(tag)], 2
+
+    return name, 1
+
+
+def _sibling_names(parent: str) -> set[str] | None:
+    """
+    Return the names of the entries in the `parent` directory.
+
+    The names are read with a single `os.scandir()` call, so enumeration loops can
+    probe candidate names against a set instead of calling `stat()` once per
+    candidate. Return None if the parent directory can't be listed.
+    """
+    try:
+        with os.scandir(parent) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return None
+
+
+def _name_exists(parent: str, name: str, siblings: set[str] | None) -> bool:
+    """
+    Return True if `name` is taken in `parent`.
+
+    Falls back to `os.path.exists()` (which, like `Path.exists()`, follows
+    symlinks) when the parent directory couldn't be listed.
+    """
+    if siblings is None:
+        return os.path.exists(os.path.join(parent, name))
+    return name in siblings
+
+
 def calculate_duration(frame_count: int, fps: float) -> timedelta:
     """
     Return a timedelta representing the duration of a video using frame count and fps.
@@ -283,6 +389,9 @@ def calculate_duration(frame_count: int, fps: float) -> timedelta:
     return timedelta(seconds=frame_count / fps)
 
 
+_BYTE_UNITS = ("bytes", "KB", "MB", "GB", "TB", "PB")
+
+
 def convert_bytes(n: int) -> str:
     """
     Convert n bytes (int) to a human readable string.
@@ -314,25 +423,45 @@ def convert_bytes(n: int) -> str:
         `str`: A human readable string representing the number of bytes.
     """
     n = positive_int(n)
-    for size in ["bytes", "KB", "MB", "GB", "TB"]:
-        if n < 1024.0:
-            return f"{n:.2f} {size}"
-        n /= 1024.0
+    # Each unit spans 10 bits, so the unit index falls out of the bit length.
+    index = min((n.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{n / (1 << (10 * index)):.2f} {_BYTE_UNITS[index]}"
+
 
-    return f"{n:.2f} PB"
+def _shallow_dict(obj: Any, skip_private_keys: bool = False) -> dict[str, Any]:
+    """
+    Return the fields of a dataclass instance as a dict without copying the values.
+
+    Unlike `dataclasses.asdict`, field values are not deep-copied; nested dataclasses
+    are left for the JSON encoder to convert when it reaches them.
+    """
+    d = {f.name: getattr(obj, f.name) for f in fields(obj)}
+    return remove_private_keys(d) if skip_private_keys else d
 
 
 class CustomJSONEncoder(json.JSONEncoder):
     """A custom JSON encoder for types that are not JSON serializable."""
 
+    def __init__(self, *args: Any, skip_private_keys: bool = False, **kwargs: Any):
+        """Set whether private keys of nested dataclasses are skipped."""
+        super().__init__(*args, **kwargs)
+        self.skip_private_keys = skip_private_keys
+        # Encoders are short-lived, so resolved paths can't go stale.
+        self._path_cache: dict[Path, str] = {}
+
     def default(self, obj: Any) -> Any:
         """Return a JSON serializable representation of the object."""
         if isinstance(obj, Path):
-            return obj.resolve().as_posix()
+            resolved = self._path_cache.get(obj)
+            if resolved is None:
+                resolved = self._path_cache[obj] = obj.resolve().as_posix()
+            return resolved
         if isinstance(obj, timedelta):
             return str(obj)
         if isinstance(obj, ExtractionMethod):
             return obj.value
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return _shallow_dict(obj, self.skip_private_keys)
         return super().default(obj)
 
 
@@ -340,6 +469,9 @@ class CustomJSONEncoder(json.JSONEncoder):
 class ToJsonMixin:
     """A mixin for dataclasses that can be represented as JSON."""
 
+    # Empty slots so subclasses declared with `@dataclass(slots=True)` stay dict-free.
+    __slots__ = ()
+
     def json(self, skip_private_keys: bool = False) -> str:
         """
         Return a JSON string representation of the dataclass.
@@ -354,8 +486,16 @@ class ToJsonMixin:
         -----
             `str`: JSON string representation of the dataclass.
         """
-        d = remove_private_keys(asdict(self)) if skip_private_keys else asdict(self)
-        return json.dumps(d, indent=2, cls=CustomJSONEncoder)
+        d = _shallow_dict(self, skip_private_keys)
+        return json.dumps(
+            d, indent=2, cls=CustomJSONEncoder, skip_private_keys=skip_private_keys
+        )
+
+    def _iter_json(self, skip_private_keys: bool = False) -> Iterator[str]:
+        """Return an iterator over the chunks of the JSON string representation."""
+        d = _shallow_dict(self, skip_private_keys)
+        encoder = CustomJSONEncoder(indent=2, skip_private_keys=skip_private_keys)
+        return encoder.iterencode(d)
 
     def verbose_print(self, title: str) -> None:
         """Print the public keys of the JSON to console with a title."""
@@ -364,7 +504,10 @@ class ToJsonMixin:
             "Result": "yellow",
         }
         color = color_map.get(title, "white")
-        print(f"<[{color}]{title}[/{color}]>\n{self.json(skip_private_keys=True)}")
+        print(f"<[{color}]{title}[/{color}]>")
+        # Stream the JSON chunks instead of building the whole string first.
+        sys.stdout.writelines(self._iter_json(skip_private_keys=True))
+        sys.stdout.write("\n")
 
 
 class DataclassType(Protocol):
@@ -385,11 +528,21 @@ def remove_private_keys(d: dict[str, Any]) -> dict[str, Any]:
     -----
         `dict[str, Any]`: A new dictionary containing public keys only.
     """
-    copied_dict: defaultdict[str, Any] = defaultdict(dict)
-    for k, v in d.items():
-        if not k.startswith("_"):
-            copied_dict[k] = remove_private_keys(v) if isinstance(v, dict) else v
-    return dict(copied_dict)
+    # Walk nested dicts with an explicit stack rather than recursion, so deeply
+    # nested input costs one frame and can't hit the recursion limit.
+    result: dict[str, Any] = {}
+    stack = [(d, result)]
+    while stack:
+        source, target = stack.pop()
+        for k, v in source.items():
+            if k.startswith("_"):
+                continue
+            if isinstance(v, dict):
+                target[k] = child = {}
+                stack.append((v, child))
+            else:
+                target[k] = v
+    return result
 
 
 def parse_kwargs(kwargs: dict[str, Any], obj: DataclassType) -> dict[str, Any]:
@@ -420,4 +573,12 @@ def parse_kwargs(kwargs: dict[str, Any], obj: DataclassType) -> dict[str, Any]:
     -----
         `dict`: A dictionary of keyword arguments present in the `obj` attributes.
     """
-    return {k: v for k, v in kwargs.items() if k in obj.__dataclass_fields__}
+    cls = obj if isinstance(obj, type) else type(obj)
+    field_names = _dataclass_field_names(cls)
+    return {k: v for k, v in kwargs.items() if k in field_names}
+
+
+@lru_cache(maxsize=None)
+def _dataclass_field_names(cls: type) -> frozenset[str]:
+    """Return the field names of a dataclass, cached per class."""
+    return frozenset(cls.__dataclass_fields__)
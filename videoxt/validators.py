@@ -1,13 +1,89 @@
 """Contains functions to validate user input and other data."""
-import re
+import os
+import stat
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import cast
+from typing import Any, TypeVar
 
 import videoxt.constants as C
-import videoxt.utils as U
 from videoxt.exceptions import ValidationError
 
+# Characters a filename can't contain; see `valid_filename`.
+_INVALID_FILENAME_CHARS = frozenset('\\/:*?"<>|')
 
+# Colon positions for each valid timestamp length: M:SS, MM:SS, H:MM:SS, HH:MM:SS.
+_TIMESTAMP_SHAPES = {4: (1,), 5: (2,), 7: (1, 4), 8: (2, 5)}
+
+# Directories `valid_dir` rejects or resolves, built once rather than per call.
+_ROOT_DIR = Path("/")
+_CURRENT_DIR = Path(".")
+_PARENT_DIR = Path("..")
+
+# Frozen, module-local copies of the supported values for membership checks.
+_AUDIO_FORMATS = frozenset(C.SUPPORTED_AUDIO_FORMATS)
+_IMAGE_FORMATS = frozenset(C.SUPPORTED_IMAGE_FORMATS)
+_VIDEO_FORMATS = frozenset(C.SUPPORTED_VIDEO_FORMATS)
+
+# Valid rotate values keyed by themselves and their string form, so the common
+# inputs are validated and converted with one lookup. Floats like 90.0 hash equal to
+# their int and hit the same keys.
+_ROTATE_LOOKUP: dict[int | str, int] = {
+    **{v: v for v in C.VALID_ROTATE_VALUES},
+    **{str(v): v for v in C.VALID_ROTATE_VALUES},
+}
+
+# Constant error message tails, formatted once instead of on every failure.
+_ROTATE_ERROR_TAIL = f"\nAllowed values: {C.VALID_ROTATE_VALUES}"
+_AUDIO_FORMATS_ERROR_TAIL = f"\nSupported formats: {C.SUPPORTED_AUDIO_FORMATS}"
+_IMAGE_FORMATS_ERROR_TAIL = f"\nSupported image formats: {C.SUPPORTED_IMAGE_FORMATS}"
+_VIDEO_FORMATS_ERROR_TAIL = f"\nSupported: {C.SUPPORTED_VIDEO_FORMATS}"
+
+_T = TypeVar("_T")
+
+
+def _memoized(func: Callable[[Any], _T]) -> Callable[[Any], _T]:
+    """
+    Memoize a single-argument validator on its (hashable) input.
+
+    Validators like `positive_int` or `valid_audio_format` are pure and get called
+    repeatedly with the same values, so results are cached. Unhashable input skips the
+    cache so the validator still raises its usual `ValidationError`. Exceptions are
+    never cached.
+    """
+    cached = lru_cache(maxsize=256)(func)
+
+    @wraps(func)
+    def wrapper(value: Any) -> _T:
+        try:
+            hash(value)
+        except TypeError:
+            return func(value)
+        return cached(value)
+
+    return wrapper
+
+
+def _to_float(n: float | int | str, expected: str) -> float:
+    """
+    Convert `n` to a float for the numeric validators, returning floats unchanged.
+
+    Raises:
+    -----
+        `ValidationError`: If `n` can't be converted, naming the `expected` type.
+    """
+    if isinstance(n, float):
+        return n
+
+    try:
+        return float(n)
+    except (ValueError, TypeError):
+        raise ValidationError(f"Expected {expected}, got {n!r}")
+
+
+@_memoized
 def positive_int(n: float | int | str) -> int:
     """
     Return a positive integer from a float, integer or string.
@@ -24,10 +100,20 @@ def positive_int(n: float | int | str) -> int:
     -----
         `ValidationError`: If the number is not a positive integer.
     """
-    try:
-        value = float(n)
-    except (ValueError, TypeError):
-        raise ValidationError(f"Expected integer, got {n!r}")
+    # Bools are ints too; leave them to the general path.
+    if isinstance(n, int) and not isinstance(n, bool):
+        if n <= 0:
+            raise ValidationError(f"Expected positive integer, got {n}")
+        return n
+
+    # Plain digit strings (e.g. from argparse) skip the float round trip.
+    if isinstance(n, str) and n.isascii() and n.isdigit():
+        value_int = int(n)
+        if value_int <= 0:
+            raise ValidationError(f"Expected positive integer, got {n}")
+        return value_int
+
+    value = _to_float(n, "integer")
 
     if not value.is_integer():
         raise ValidationError(f"Expected integer, got {n}")
@@ -38,6 +124,7 @@ def positive_int(n: float | int | str) -> int:
     return int(value)
 
 
+@_memoized
 def positive_float(n: float | int | str) -> float:
     """
     Return a positive float from a float, integer or string.
@@ -54,10 +141,7 @@ def positive_float(n: float | int | str) -> float:
     -----
         `ValidationError`: If the number is not a positive float.
     """
-    try:
-        value = float(n)
-    except (ValueError, TypeError):
-        raise ValidationError(f"Expected numeric value, got {n!r}")
+    value = _to_float(n, "numeric value")
 
     if value <= 0:
         raise ValidationError(f"Expected positive number, got {n}")
@@ -65,6 +149,7 @@ def positive_float(n: float | int | str) -> float:
     return value
 
 
+@_memoized
 def non_negative_int(n: float | int | str) -> int:
     """
     Return a non-negative integer from a float, integer or string.
@@ -81,13 +166,21 @@ def non_negative_int(n: float | int | str) -> int:
     -----
         `ValidationError`: If the number is not a non-negative integer.
     """
-    try:
-        value = float(n)
-    except (ValueError, TypeError):
-        raise ValidationError(f"Expected integer, got {n!r}")
+    # Bools are ints too; leave them to the general path.
+    if isinstance(n, int) and not isinstance(n, bool):
+        if n < 0:
+            raise ValidationError(f"Expected non-negative integer, got {n}")
+        return n
+
+    # Plain digit strings (e.g. from argparse) skip the float round trip and, having
+    # no sign, can't be negative.
+    if isinstance(n, str) and n.isascii() and n.isdigit():
+        return int(n)
+
+    value = _to_float(n, "integer")
 
     if not value.is_integer():
-        raise ValidationError(f"Expected integer, got {n!r}")
+        raise ValidationError(f"Expected integer, got {n}")
 
     if value < 0:
         raise ValidationError(f"Expected non-negative integer, got {n}")
@@ -95,6 +188,7 @@ def non_negative_int(n: float | int | str) -> int:
     return int(value)
 
 
+@_memoized
 def non_negative_float(n: float | int | str) -> float:
     """
     Return a non-negative float from a float, integer or string.
@@ -111,10 +205,7 @@ def non_negative_float(n: float | int | str) -> float:
     -----
         `ValidationError`: If the number is not a non-negative float.
     """
-    try:
-        value = float(n)
-    except (ValueError, TypeError):
-        raise ValidationError(f"Expected numeric value, got {n!r}")
+    value = _to_float(n, "numeric value")
 
     if value < 0:
         raise ValidationError(f"Expected non-negative number, got {n}")
@@ -122,6 +213,59 @@ def non_negative_float(n: float | int | str) -> float:
     return value
 
 
+# Per-scope memo of absolute path -> st_mode; see `path_check_cache`.
+_STAT_CACHE: ContextVar[dict[str, int] | None] = ContextVar("_STAT_CACHE", default=None)
+
+
+def _stat_mode(path: str) -> int:
+    """
+    Return the `st_mode` of `path`.
+
+    Outside a `path_check_cache()` block every call issues a fresh `stat()`. Inside
+    one, successful lookups are memoized on the absolute path for the rest of the
+    block; failures are never stored.
+    """
+    cache = _STAT_CACHE.get()
+    if cache is None:
+        return os.stat(path).st_mode
+
+    key = os.path.abspath(path)
+    mode = cache.get(key)
+    if mode is None:
+        mode = cache[key] = os.stat(key).st_mode
+    return mode
+
+
+@contextmanager
+def path_check_cache() -> Iterator[None]:
+    """
+    Within the block, `valid_dir` / `valid_filepath` stat each absolute path once.
+
+    Meant to wrap the validation of a single request or batch, where the same video
+    and destination paths are checked repeatedly. The cache is dropped when the block
+    exits, and is local to the current thread or task. Nested blocks share the
+    outermost cache.
+
+    Usage:
+    -----
+    ```python
+    >>> import videoxt.validators as V
+    >>> with V.path_check_cache():
+    ...     V.valid_dir('path/to/dir')
+    ...     V.valid_dir('path/to/dir')  # no second stat()
+    ```
+    """
+    if _STAT_CACHE.get() is not None:
+        yield
+        return
+
+    token = _STAT_CACHE.set({})
+    try:
+        yield
+    finally:
+        _STAT_CACHE.reset(token)
+
+
 def valid_dir(directory: Path | str) -> Path:
     """
     Validate a path is a directory and exists and return it.
@@ -141,18 +285,22 @@ def valid_dir(directory: Path | str) -> Path:
     if directory is None:
         raise ValidationError(f"Directory cannot be None, got {directory!r}")
 
-    dir_path = Path(directory)
+    dir_path = directory if isinstance(directory, Path) else Path(directory)
+
+    try:
+        mode = _stat_mode(os.fspath(dir_path))
+    except (OSError, ValueError):
+        mode = 0
 
-    if not dir_path.is_dir():
+    if not stat.S_ISDIR(mode):
         raise ValidationError(f"Directory not found, got {directory!r}")
 
-    if dir_path == Path("/"):
+    if dir_path == _ROOT_DIR:
         raise ValidationError(f"Invalid directory, got {directory!r}")
 
-    if dir_path == Path("."):
+    if dir_path == _CURRENT_DIR:
         dir_path = Path.cwd()
-
-    if dir_path == Path(".."):
+    elif dir_path == _PARENT_DIR:
         dir_path = Path.cwd().parent
 
     return dir_path
@@ -181,15 +329,21 @@ def valid_filepath(filepath: Path | str, is_video: bool = False) -> Path:
     if filepath is None:
         raise ValidationError(f"Filepath cannot be None, got {filepath!r}")
 
-    try:
-        fp = Path(filepath)
-    except TypeError:
-        raise ValidationError(f"Invalid filepath, got {filepath!r}")
+    if isinstance(filepath, Path):
+        fp = filepath
+    else:
+        try:
+            fp = Path(filepath)
+        except TypeError:
+            raise ValidationError(f"Invalid filepath, got {filepath!r}")
 
-    if not fp.exists():
+    # One stat() answers both "does it exist" and "is it a regular file".
+    try:
+        mode = _stat_mode(os.fspath(fp))
+    except (OSError, ValueError):
         raise ValidationError(f"File not found, got {filepath!r}")
 
-    if not fp.is_file():
+    if not stat.S_ISREG(mode):
         raise ValidationError(f"Filepath provided is not a file, got {filepath!r}")
 
     if is_video:
@@ -198,6 +352,7 @@ def valid_filepath(filepath: Path | str, is_video: bool = False) -> Path:
     return fp
 
 
+@_memoized
 def valid_filename(filename: str) -> str:
     """
     Validate a filename does not contain invalid characters and return it.
@@ -216,14 +371,11 @@ def valid_filename(filename: str) -> str:
     -----
         `ValidationError`: If the filename is None, empty or contains invalid chars.
     """
-    if filename is None:
-        raise ValidationError(f"Invalid filename, got {filename!r}")
-
+    # Covers both None and the empty string.
     if not filename:
         raise ValidationError(f"Invalid filename, got {filename!r}")
 
-    invalid_chars = r"[\\/:*?\"<>|]"
-    if re.search(invalid_chars, filename):
+    if not _INVALID_FILENAME_CHARS.isdisjoint(filename):
         raise ValidationError(
             f"Invalid filename, got {filename!r}\n"
             f"filename can't contain any of the following characters: \\/:*?\"<>|"
@@ -253,21 +405,63 @@ def valid_timestamp(timestamp: str) -> str:
     Raises:
     -----
         `ValidationError`:
-            If the timestamp is None, empty, or does not match the regex pattern.
+            If the timestamp is None, empty, or not in one of the valid formats.
+    """
+    return _valid_timestamp_seconds(timestamp)[0]
+
+
+@_memoized
+def _valid_timestamp_seconds(timestamp: str) -> tuple[str, int]:
+    """
+    Validate a timestamp like `valid_timestamp` and also return its total seconds.
+
+    The seconds are accumulated while the timestamp is checked, so callers that
+    need both don't parse the string twice. Memoized, so `valid_timestamp` and
+    `valid_stop_timestamp` share the result for a repeated timestamp.
     """
     if timestamp is None or not timestamp:
         raise ValidationError(f"Timestamp string is empty or None, got {timestamp!r}")
 
-    timestamp = timestamp.split(".")[0]
+    timestamp = timestamp.partition(".")[0]
 
-    regex = r"^([0-9]|[0-5][0-9])(:[0-5][0-9]){1,2}$"
-    if not bool(re.match(regex, timestamp)):
+    seconds = _parse_timestamp(timestamp)
+    if seconds is None:
         raise ValidationError(
             f"Invalid timestamp format, got {timestamp!r}\n"
             f"Allowed: 'M:SS', 'MM:SS', 'H:MM:SS', 'HH:MM:SS'"
         )
 
-    return timestamp
+    return timestamp, seconds
+
+
+def _parse_timestamp(timestamp: str) -> int | None:
+    """
+    Return the total seconds of a `M:SS`, `MM:SS`, `H:MM:SS` or `HH:MM:SS` timestamp.
+
+    The shape is checked character by character instead of running a regex, and the
+    seconds are accumulated in the same pass. A two digit leading field and every
+    field after a colon must be in the range 00-59. Return None if the timestamp
+    doesn't match any of the formats.
+    """
+    colons = _TIMESTAMP_SHAPES.get(len(timestamp))
+    if colons is None:
+        return None
+
+    lead = colons[0]
+    total = 0
+    for j in range(lead):
+        c = timestamp[j]
+        if not "0" <= c <= ("5" if j == 0 and lead == 2 else "9"):
+            return None
+        total = total * 10 + ord(c) - 48
+
+    for i in colons:
+        tens, ones = timestamp[i + 1], timestamp[i + 2]
+        if timestamp[i] != ":" or not ("0" <= tens <= "5" and "0" <= ones <= "9"):
+            return None
+        total = total * 60 + (ord(tens) - 48) * 10 + ord(ones) - 48
+
+    return total
 
 
 def valid_start_timestamp(start_timestamp: str) -> str:
@@ -287,15 +481,8 @@ def valid_start_timestamp(start_timestamp: str) -> str:
     -----
         `str`: The timestamp as a string if valid.
     """
-    timestamp = valid_timestamp(start_timestamp)
-    timestamp_as_seconds = U.timestamp_to_seconds(timestamp)
-    timestamp_as_seconds = (
-        non_negative_float(timestamp)
-        if timestamp_as_seconds is None
-        else non_negative_float(timestamp_as_seconds)
-    )
-
-    return timestamp
+    # A well-formed timestamp can't be negative, so the format check is enough.
+    return valid_timestamp(start_timestamp)
 
 
 def valid_stop_timestamp(stop_timestamp: str) -> str:
@@ -315,17 +502,14 @@ def valid_stop_timestamp(stop_timestamp: str) -> str:
     -----
         `str`: The timestamp as a string if valid.
     """
-    timestamp = valid_timestamp(stop_timestamp)
-    timestamp_as_seconds = U.timestamp_to_seconds(timestamp)
-    timestamp_as_seconds = (
-        positive_float(timestamp)
-        if timestamp_as_seconds is None
-        else positive_float(timestamp_as_seconds)
-    )
+    timestamp, seconds = _valid_timestamp_seconds(stop_timestamp)
+    if seconds <= 0:
+        raise ValidationError(f"Expected positive number, got {seconds}")
 
     return timestamp
 
 
+@_memoized
 def valid_start_time(start_time: float | int | str) -> float | str:
     """
     Validate the start time param is a not negative or a properly formatted timestamp.
@@ -350,28 +534,12 @@ def valid_start_time(start_time: float | int | str) -> float | str:
     if start_time is None:
         raise ValidationError("Start time cannot be None.")
 
-    try:
-        start_time_float = float(start_time)
-    except ValueError:
-        try:
-            return valid_start_timestamp(str(start_time))
-        except ValidationError:
-            raise ValidationError(
-                f"Invalid start time, got {start_time!r}\n"
-                "Start time must be a non-negative number or a properly formatted "
-                "timestamp (Ex: 'HH:MM:SS')."
-            )
-    else:
-        try:
-            return non_negative_float(start_time_float)
-        except ValidationError:
-            raise ValidationError(
-                f"Invalid start time, got {start_time!r}\n"
-                "Start time must be a non-negative number or a properly formatted "
-                "timestamp (Ex: 'HH:MM:SS')."
-            )
+    return _valid_time(
+        start_time, non_negative_float, valid_start_timestamp, "Start", "non-negative"
+    )
 
 
+@_memoized
 def valid_stop_time(stop_time: float | int | str) -> float | str:
     """
     Validate the stop time param is a positive number or a properly formatted timestamp.
@@ -396,26 +564,46 @@ def valid_stop_time(stop_time: float | int | str) -> float | str:
     if stop_time is None:
         raise ValidationError("Stop time cannot be None.")
 
+    return _valid_time(
+        stop_time, positive_float, valid_stop_timestamp, "Stop", "positive"
+    )
+
+
+def _valid_time(
+    time: float | int | str,
+    validate_number: Callable[[float | int | str], float],
+    validate_timestamp: Callable[[str], str],
+    label: str,
+    requirement: str,
+) -> float | str:
+    """
+    Shared implementation of `valid_start_time` and `valid_stop_time`.
+
+    Non-string input is handed to `validate_number` as-is. Strings containing a colon
+    go straight to `validate_timestamp`, without first failing a `float()` conversion;
+    other strings are checked with `validate_number`, falling back to
+    `validate_timestamp` if they can't be converted to a float. Failures are re-raised
+    with a message built from `label` and `requirement`.
+    """
     try:
-        stop_time_float = float(stop_time)
-    except ValueError:
-        try:
-            return valid_stop_timestamp(str(stop_time))
-        except ValidationError:
-            raise ValidationError(
-                f"Invalid stop time, got {stop_time!r}\n"
-                "Stop time must be a positive number or a properly formatted "
-                "timestamp (Ex: 'HH:MM:SS')."
-            )
-    else:
+        if not isinstance(time, str):
+            return validate_number(time)
+
+        if ":" in time:
+            return validate_timestamp(time)
+
         try:
-            return positive_float(stop_time_float)
-        except ValidationError:
-            raise ValidationError(
-                f"Invalid stop time, got {stop_time!r}\n"
-                "Stop time must be a positive number or a properly formatted "
-                "timestamp (Ex: 'HH:MM:SS')."
-            )
+            time_float = float(time)
+        except ValueError:
+            return validate_timestamp(time)
+
+        return validate_number(time_float)
+    except ValidationError:
+        raise ValidationError(
+            f"Invalid {label.lower()} time, got {time!r}\n"
+            f"{label} time must be a {requirement} number or a properly formatted "
+            "timestamp (Ex: 'HH:MM:SS')."
+        )
 
 
 def valid_extraction_range(
@@ -444,11 +632,8 @@ def valid_extraction_range(
         - If the start time is greater than or equal to the video duration.
         - If the stop time is less than or equal to the start time.
     """
-    if stop > duration:
-        stop = duration
-
-    if start < 0:
-        start = 0
+    stop = min(stop, duration)
+    start = max(start, 0)
 
     if start >= duration:
         raise ValidationError(
@@ -481,14 +666,15 @@ def valid_dimensions(dimensions: tuple[int, int]) -> tuple[int, int]:
             If the length of the tuple isn't 2 or one or more of the values are not
             positive integers
     """
-    if len(dimensions) != 2:
+    try:
+        width, height = dimensions
+    except ValueError:
         raise ValidationError(f"Invalid dimensions, got {dimensions!r}")
 
-    dims = tuple([positive_int(dim) for dim in list(dimensions)])
-
-    return cast(tuple[int, int], dims)
+    return positive_int(width), positive_int(height)
 
 
+@_memoized
 def valid_rotate_value(n: float | int | str) -> int:
     """
     Validate a rotate value is either 0, 90, 180 or 270.
@@ -505,23 +691,35 @@ def valid_rotate_value(n: float | int | str) -> int:
     -----
         `ValidationError`: If the rotate value is invalid.
     """
+    try:
+        return _ROTATE_LOOKUP[n]
+    except (KeyError, TypeError):
+        pass
+
+    # Less common spellings (e.g. ' 90' or 90.5) keep the original int() semantics.
     try:
         val = int(n)
     except ValueError:
-        raise ValidationError(
-            f"Invalid rotate value, got {n!r}\n"
-            f"Allowed values: {C.VALID_ROTATE_VALUES}"
-        )
+        raise ValidationError(f"Invalid rotate value, got {n!r}{_ROTATE_ERROR_TAIL}")
 
-    if val not in C.VALID_ROTATE_VALUES:
-        raise ValidationError(
-            f"Invalid rotate value, got {n}\n"
-            f"Allowed values: {C.VALID_ROTATE_VALUES}"
-        )
+    if val not in _ROTATE_LOOKUP:
+        raise ValidationError(f"Invalid rotate value, got {n}{_ROTATE_ERROR_TAIL}")
 
     return val
 
 
+def _normalize_format(value: str) -> str:
+    """
+    Return a format or suffix lowercased and stripped of any leading periods.
+
+    Each step is skipped when it wouldn't change the string, so the common
+    already-normalized input (e.g. 'mp4') is returned without allocating a copy.
+    """
+    fmt = value.lstrip(".") if value.startswith(".") else value
+    return fmt if fmt.islower() else fmt.lower()
+
+
+@_memoized
 def valid_audio_format(audio_format: str) -> str:
     """
     Validate audio format is supported by `videoxt` and return it if so.
@@ -543,16 +741,16 @@ def valid_audio_format(audio_format: str) -> str:
     -----
         `ValidationError`: If the audio format is not supported.
     """
-    fmt = audio_format.lower().lstrip(".")
-    if fmt not in C.SUPPORTED_AUDIO_FORMATS:
+    fmt = _normalize_format(audio_format)
+    if fmt not in _AUDIO_FORMATS:
         raise ValidationError(
-            f"Unsupported audio format, got {audio_format!r}\n"
-            f"Supported formats: {C.SUPPORTED_AUDIO_FORMATS}"
+            f"Unsupported audio format, got {audio_format!r}{_AUDIO_FORMATS_ERROR_TAIL}"
         )
 
     return fmt
 
 
+@_memoized
 def valid_image_format(image_format: str) -> str:
     """
     Validate image format is supported by `videoxt` and return it if so.
@@ -574,11 +772,10 @@ def valid_image_format(image_format: str) -> str:
     -----
         `ValidationError`: If the image format is not supported.
     """
-    fmt = image_format.lower().lstrip(".")
-    if fmt not in C.SUPPORTED_IMAGE_FORMATS:
+    fmt = _normalize_format(image_format)
+    if fmt not in _IMAGE_FORMATS:
         raise ValidationError(
-            f"Invalid image format, got {image_format!r}\n"
-            f"Supported image formats: {C.SUPPORTED_IMAGE_FORMATS}"
+            f"Invalid image format, got {image_format!r}{_IMAGE_FORMATS_ERROR_TAIL}"
         )
 
     return fmt
@@ -603,17 +800,21 @@ def valid_volume(volume: float | int | str) -> float:
     if volume is None:
         raise ValidationError("Volume cannot be None.")
 
-    if isinstance(volume, (float, int)):
-        return volume if volume > 0 else 0
+    if isinstance(volume, float):
+        return volume if volume > 0.0 else 0.0
+
+    if isinstance(volume, int) and not isinstance(volume, bool):
+        return float(volume) if volume > 0 else 0.0
 
     try:
         vol = float(volume)
     except (ValueError, TypeError):
         raise ValidationError(f"Volume expects numeric value, got {volume!r}")
 
-    return vol if vol > 0 else 0
+    return vol if vol > 0.0 else 0.0
 
 
+@_memoized
 def valid_video_file_suffix(suffix: str) -> str:
     """
     Validate suffix provided is supported by `videoxt` and return it.
@@ -633,11 +834,10 @@ def valid_video_file_suffix(suffix: str) -> str:
     -----
         `ValidationError`: If the video format is not supported.
     """
-    sfx = suffix.lower().lstrip(".")
-    if sfx not in C.SUPPORTED_VIDEO_FORMATS:
+    sfx = _normalize_format(suffix)
+    if sfx not in _VIDEO_FORMATS:
         raise ValidationError(
-            f"Invalid video file suffix, got {suffix!r}\n"
-            f"Supported: {C.SUPPORTED_VIDEO_FORMATS}"
+            f"Invalid video file suffix, got {suffix!r}{_VIDEO_FORMATS_ERROR_TAIL}"
         )
 
     return sfx
@@ -693,14 +893,16 @@ def valid_dimensions_str(dimensions: str) -> tuple[int, int]:
             "Expected format: 'WxH' (Ex: '1920x1080')"
         )
 
-    if dimensions.count("x") > 1:
+    width, _, height = dimensions.partition("x")
+    if "x" in height:
         raise ValidationError(
             f"Too many dimensions provided, got {dimensions!r}\n"
             "Expected format: 'WxH' (Ex: '1920x1080')"
         )
 
+    # Without an 'x' the height is empty and fails validation below.
     try:
-        dims = tuple(positive_int(dim) for dim in tuple(dimensions.split("x")))
+        return positive_int(width), positive_int(height)
     except ValidationError:
         raise ValidationError(
             f"Invalid dimensions, got {dimensions!r}\n"
@@ -708,8 +910,6 @@ def valid_dimensions_str(dimensions: str) -> tuple[int, int]:
             "Expected format: 'WxH' (Ex: '1920x1080')"
         )
 
-    return cast(tuple[int, int], dims)
-
 
 def valid_resize(resize: float | int | str) -> float:
     """
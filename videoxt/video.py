@@ -1,13 +1,14 @@
 """Contains Video class and functions for validating and retrieving video properties."""
+import os
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import cv2  # type: ignore
-from moviepy.editor import VideoFileClip  # type: ignore
 
 import videoxt.utils as U
 import videoxt.validators as V
@@ -17,6 +18,9 @@ from videoxt.exceptions import (
     VideoValidationError,
 )
 
+# Validated (width, height) tuples, interned by `Video.validate_dimensions`.
+_DIMENSIONS: dict[tuple[int, int], tuple[int, int]] = {}
+
 
 @dataclass
 class Video:
@@ -45,7 +49,7 @@ class Video:
         `duration_timestamp` (str):
             Duration of the video in `HH:MM:SS` format.
         `has_audio` (bool):
-            True if the video has audio, False otherwise.
+            True if the video has audio, False otherwise. Read on first access.
         `filesize_bytes` (int):
             Size of the video file in bytes.
         `filesize` (str):
@@ -73,7 +77,17 @@ class Video:
         self.validate_frame_count()
         self.setattrs_duration()
         self.setattr_filesize()
-        self.setattr_has_audio()
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Set `has_audio` on first access. Checking for audio opens the file with moviepy
+        (and an ffmpeg subprocess), so it's deferred until something needs it.
+        """
+        if name == "has_audio":
+            return self.setattr_has_audio()
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def validate_filepath(self) -> Path:
         """Validate the file is a video file and exists."""
@@ -82,12 +96,16 @@ class Video:
 
     def validate_filesize_bytes(self) -> int:
         """Validate the video file size in bytes is a positive integer."""
-        self.filesize_bytes = V.positive_int(self.filepath.stat().st_size)
+        # Kept so `setattrs_from_opencap` can reuse it instead of calling stat() again.
+        self._stat = self.filepath.stat()
+        self.filesize_bytes = V.positive_int(self._stat.st_size)
         return self.filesize_bytes
 
     def setattrs_from_opencap(self) -> tuple[tuple[int, int], float, int]:
         """Set the dimensions, fps and frame count read from an opened video capture."""
-        properties = fetch_video_properties(self.filepath)
+        properties = fetch_video_properties(
+            self.filepath, stat_result=getattr(self, "_stat", None)
+        )
         self.dimensions = properties.get("dimensions", None)
         self.fps = properties.get("fps", None)
         self.frame_count = properties.get("frame_count", None)
@@ -103,12 +121,14 @@ class Video:
             )
 
         try:
-            self.dimensions = V.valid_dimensions(self.dimensions)
+            dimensions = V.valid_dimensions(self.dimensions)
         except ValidationError as err:
             raise VideoValidationError(
                 "The video dimensions are invalid. Please check the file."
             ) from err
 
+        # Videos sharing a resolution share one tuple.
+        self.dimensions = _DIMENSIONS.setdefault(dimensions, dimensions)
         return self.dimensions
 
     def validate_fps(self) -> float:
@@ -149,8 +169,11 @@ class Video:
 
     def setattrs_duration(self) -> tuple[timedelta, float, str]:
         """Set the duration attributes."""
-        self.duration = U.calculate_duration(self.frame_count, self.fps)
-        self.duration_seconds = self.duration.total_seconds()
+        # Frame count and fps are already validated, so the seconds are computed
+        # directly rather than through `U.calculate_duration` and back out of the
+        # timedelta (which would also round them to whole microseconds).
+        self.duration_seconds = self.frame_count / self.fps
+        self.duration = timedelta(seconds=self.duration_seconds)
         self.duration_timestamp = U.seconds_to_timestamp(self.duration_seconds)
         return self.duration, self.duration_seconds, self.duration_timestamp
 
@@ -160,20 +183,39 @@ class Video:
         return self.filesize
 
     def setattr_has_audio(self) -> bool:
-        """Set the has_audio attribute with moviepy.editor import VideoFileClip.audio"""
-        with VideoFileClip(str(self.filepath)) as clip:
-            self.has_audio = bool(clip.audio)
+        """
+        Set the has_audio attribute from the stream info ffmpeg reports for the file.
+
+        Unlike opening a `VideoFileClip`, this doesn't start frame or audio readers.
+        moviepy is imported here, on first use, rather than when the module loads.
+        """
+        from moviepy.video.io.ffmpeg_reader import (  # type: ignore
+            ffmpeg_parse_infos,
+        )
+
+        infos = ffmpeg_parse_infos(str(self.filepath), check_duration=False)
+        self.has_audio = bool(infos["audio_found"])
         return self.has_audio
 
 
-def fetch_video_properties(filepath: Path) -> dict[str, Any]:
+def fetch_video_properties(
+    filepath: Path, stat_result: os.stat_result | None = None
+) -> dict[str, Any]:
     """
     Open the video file to retrieve and return the video's dimensions, fps, and frame
     count as a dictionary.
 
+    Results are memoized on the file's path, modification time and size, so probing
+    the same unchanged file again doesn't reopen it. A file that is modified or
+    replaced is probed afresh.
+
     Args:
     -----
-        `filepath` (Path): Path to the video file.
+        `filepath` (Path):
+            Path to the video file.
+        `stat_result` (os.stat_result | None):
+            The file's stat() result if the caller already has it, to avoid another
+            stat() call. Defaults to None.
 
     Returns:
     -----
@@ -184,6 +226,33 @@ def fetch_video_properties(filepath: Path) -> dict[str, Any]:
             - "fps" (float): Frame rate of the video.
             - "frame_count" (int): Number of frames in the video.
     """
+    if not isinstance(filepath, (str, os.PathLike)):
+        return _read_video_properties(filepath)
+
+    path = os.fspath(filepath)
+    st = stat_result
+    if st is None:
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            # Let `open_video_capture` raise its usual error for the missing file.
+            return _read_video_properties(filepath)
+
+    # Copy so callers can't mutate the cached dictionary.
+    return dict(_cached_video_properties(path, st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=256)
+def _cached_video_properties(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Memoized `_read_video_properties`. `mtime_ns` and `size` are only part of the cache
+    key, so a changed file misses the cache. Failed reads raise and aren't cached.
+    """
+    return _read_video_properties(path)
+
+
+def _read_video_properties(filepath: Path | str) -> dict[str, Any]:
+    """Read the unvalidated dimensions, fps and frame count with `cv2.VideoCapture`."""
     with open_video_capture(filepath) as opencap:
         frame_height: int = opencap.get(cv2.CAP_PROP_FRAME_HEIGHT)
         frame_width: int = opencap.get(cv2.CAP_PROP_FRAME_WIDTH)
@@ -198,7 +267,7 @@ def fetch_video_properties(filepath: Path) -> dict[str, Any]:
 
 
 @contextmanager
-def open_video_capture(filepath: Path) -> Iterator[cv2.VideoCapture]:
+def open_video_capture(filepath: Path | str) -> Iterator[cv2.VideoCapture]:
     """
     Context manager for opening a video file with `cv2.VideoCapture`.
 
@@ -214,7 +283,7 @@ def open_video_capture(filepath: Path) -> Iterator[cv2.VideoCapture]:
 
     Args:
     -----
-        `filepath` (Path): Path to the video file.
+        `filepath` (Path | str): Path to the video file.
 
     Yields:
     -----
@@ -229,7 +298,8 @@ def open_video_capture(filepath: Path) -> Iterator[cv2.VideoCapture]:
             https://docs.opencv.org/4.8.0/d8/dfe/classcv_1_1VideoCapture.html
     """
     try:
-        video_capture = cv2.VideoCapture(str(filepath))
+        # Naming the FFmpeg backend skips OpenCV's trial of every available backend.
+        video_capture = cv2.VideoCapture(str(filepath), cv2.CAP_FFMPEG)
         if not video_capture.isOpened():
             raise ClosedVideoCaptureError(
                 "Unable to open the video file or maintain it in an open state. Please "